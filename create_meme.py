@@ -4,9 +4,135 @@ Creates a professional four-panel visualization demonstrating selection bias.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
-from matplotlib.lines import Line2D
+from PIL import Image, ImageDraw
+
+from dtype_utils import audit_dtype
+from step4_create_block_letter import load_bold_font
+
+
+def _write_panel(region: np.ndarray, img: np.ndarray) -> None:
+    """
+    Write a grayscale panel into its (height, width, 3) region of the RGB canvas.
+    Float panels in [0, 1] are scaled by a float32 constant and rounded straight
+    into the canvas, so there is no per-panel uint8 array and no float64 promotion.
+    """
+    if img.dtype == np.uint8:
+        region[...] = img[:, :, None]
+    else:
+        # Same rounding as dtype_utils.from_float
+        scaled = np.clip(img, 0.0, 1.0)[:, :, None] * np.float32(255)
+        np.rint(scaled, out=region, casting='unsafe')
+
+
+class MemeRenderer:
+    """
+    Reusable four-panel meme layout for panels of one size.
+    
+    The canvas, borders, separators and labels are built once in __init__;
+    each render() only writes the four panels into their regions and encodes
+    the PNG. Use this directly when rendering many memes of the same size
+    (parameter sweeps, animation frames); create_statistics_meme builds a
+    renderer for a single meme.
+    
+    Parameters
+    ----------
+    height : int
+        Height of each panel in pixels
+    width : int
+        Width of each panel in pixels
+    background_color : str
+        Background color of the label band. Default "white".
+        Can be any valid PIL color name (e.g., "pink", "lightgray").
+    """
+    
+    LABELS = ["Reality", "Your Model", "Selection Bias", "Estimate"]
+    
+    def __init__(self, height: int, width: int, background_color: str = "white"):
+        self.height = height
+        self.width = width
+        
+        # Layout sizes scale with the panel width
+        border = max(1, round(0.028 * width))
+        font_size = max(8, round(0.061 * width))
+        font = load_bold_font(font_size)
+        title_h = round(font_size * 1.5)
+        
+        self.canvas_w = 4 * width + 5 * border
+        self.canvas_h = title_h + height + 2 * border
+        
+        # Light blue canvas provides the border and separator lines between
+        # panels; the label band above the top border uses the background color
+        canvas = Image.new('RGB', (self.canvas_w, self.canvas_h), 'lightblue')
+        draw = ImageDraw.Draw(canvas)
+        draw.rectangle([0, 0, self.canvas_w - 1, title_h - 1], fill=background_color)
+        
+        # Add each label above its panel
+        panel_x = [border + i * (width + border) for i in range(4)]
+        for label, x0 in zip(self.LABELS, panel_x):
+            draw.text((x0 + width // 2, title_h // 2), label,
+                      fill='black', font=font, anchor='mm')
+        
+        # Panels are written in place into disjoint views of one buffer
+        self._canvas = np.array(canvas)
+        y0 = title_h + border
+        self._regions = [self._canvas[y0:y0 + height, x0:x0 + width]
+                         for x0 in panel_x]
+    
+    def render(
+        self,
+        panels: list[np.ndarray],
+        output_path: str,
+        dpi: int = 150,
+        compress_level: int = 1,
+        palette_colors: int | None = None,
+        verbose: bool = False
+    ) -> None:
+        """
+        Write the four panels into the cached layout and save it as a PNG.
+        
+        Parameters
+        ----------
+        panels : list[np.ndarray]
+            The four panels (Reality, Your Model, Selection Bias, Estimate) as
+            2D uint8 arrays, or float32 in [0, 1], of shape (height, width)
+        output_path : str
+            Path where the meme PNG file will be saved
+        dpi : int
+            Resolution recorded in the PNG metadata. Default 150.
+        compress_level : int
+            zlib compression level for the PNG encoder (0-9). Default 1.
+        palette_colors : int | None
+            If given, quantize to this many colors and save a 'P' PNG.
+        verbose : bool
+            If True, print the dtype and memory footprint of each panel.
+        
+        Raises
+        ------
+        ValueError
+            If there are not four panels or one has the wrong shape or dtype.
+        """
+        if len(panels) != len(self.LABELS):
+            raise ValueError(f"Expected {len(self.LABELS)} panels, got {len(panels)}")
+        if verbose:
+            print("Panel dtypes:")
+        for label, img in zip(self.LABELS, panels):
+            audit_dtype(f"{label} panel", img, verbose=verbose)
+            if img.shape != (self.height, self.width):
+                raise ValueError(
+                    f"{label} panel has shape {img.shape}, "
+                    f"expected {(self.height, self.width)}. "
+                    f"Use resize_utils.resize_area_batch to resize it first."
+                )
+        
+        for region, img in zip(self._regions, panels):
+            _write_panel(region, img)
+        
+        canvas = Image.fromarray(self._canvas)
+        if palette_colors is not None:
+            canvas = canvas.quantize(colors=palette_colors, method=Image.Quantize.MEDIANCUT)
+        
+        canvas.save(output_path, 'PNG', optimize=False,
+                    compress_level=compress_level, dpi=(dpi, dpi))
 
 
 def create_statistics_meme(
@@ -16,7 +142,10 @@ def create_statistics_meme(
     masked_stipple_img: np.ndarray,
     output_path: str,
     dpi: int = 150,
-    background_color: str = "white"
+    background_color: str = "white",
+    compress_level: int = 1,
+    palette_colors: int | None = None,
+    verbose: bool = False
 ) -> None:
     """
     Assemble all four panels into a professional four-panel statistics meme.
@@ -27,127 +156,69 @@ def create_statistics_meme(
     - Panel 3 (Selection Bias): Block letter representing systematic missing data pattern
     - Panel 4 (Estimate): Masked stippled image showing the biased estimate
     
+    Panels use the pipeline's canonical uint8 (0 = black, 255 = white);
+    float32 panels with values in [0, 1] are also accepted and rounded as in
+    dtype_utils.from_float. float64 panels are rejected.
+    
     Parameters
     ----------
     original_img : np.ndarray
-        Original grayscale image as 2D array (height, width) with values in [0, 1]
+        Original grayscale image as 2D uint8 array (height, width)
     stipple_img : np.ndarray
-        Stippled image as 2D array (height, width) with values in [0, 1]
+        Stippled image as 2D uint8 array (height, width)
     block_letter_img : np.ndarray
-        Block letter image as 2D array (height, width) with values in [0, 1]
+        Block letter image as 2D uint8 array (height, width)
     masked_stipple_img : np.ndarray
-        Masked stippled image as 2D array (height, width) with values in [0, 1]
+        Masked stippled image as 2D uint8 array (height, width)
     output_path : str
         Path where the final meme PNG file will be saved
     dpi : int
-        Resolution (dots per inch) for the output image. Default 150.
-        Higher values (200-300) produce publication-quality images.
+        Resolution (dots per inch) recorded in the PNG metadata. Default 150.
+        Panels are always rendered at their native pixel size.
     background_color : str
         Background color for the meme. Default "white".
-        Can be any valid matplotlib color name (e.g., "pink", "lightgray").
+        Can be any valid PIL color name (e.g., "pink", "lightgray").
+    compress_level : int
+        zlib compression level for the PNG encoder (0-9). Default 1, which
+        encodes several times faster than 9 for a slightly larger file.
+        Use 9 when file size matters more than render time.
+    palette_colors : int | None
+        If given (2-256), quantize the meme to this many colors and save it
+        as a palette-mode ('P') PNG, which is much smaller and faster to
+        encode than RGB. Default None saves full RGB. Small palettes (e.g. 16)
+        suit the stipple and letter panels but posterize a photographic
+        original image.
+    verbose : bool
+        If True, print the dtype and memory footprint of each panel
+        before rendering. Default False.
     
     Returns
     -------
     None
         The function saves the meme as a PNG file at output_path.
+    
+    Raises
+    ------
+    ValueError
+        If any panel does not have the same shape as original_img, or is not
+        uint8 or float32.
     """
     # Get image dimensions (all should be the same)
     h, w = original_img.shape
     
-    # Helper function to ensure image has correct dimensions
-    def ensure_size(img: np.ndarray, target_h: int, target_w: int, name: str) -> np.ndarray:
-        """Resize image if it doesn't match target dimensions."""
-        if img.shape != (target_h, target_w):
-            print(f"Warning: {name} has shape {img.shape}, expected {(target_h, target_w)}")
-            print(f"  Resizing {name} to match original image dimensions...")
-            from PIL import Image
-            img_pil = Image.fromarray((img * 255).astype(np.uint8))
-            img_resized = img_pil.resize((target_w, target_h), Image.Resampling.LANCZOS)
-            img_array = np.array(img_resized, dtype=np.float32) / 255.0
-            return img_array
-        return img
-    
-    # Ensure all images have the same dimensions
-    stipple_img = ensure_size(stipple_img, h, w, "stipple_img")
-    block_letter_img = ensure_size(block_letter_img, h, w, "block_letter_img")
-    masked_stipple_img = ensure_size(masked_stipple_img, h, w, "masked_stipple_img")
-    
-    # Create figure with four panels side by side
-    # Add extra height to accommodate labels above the top border
-    fig = plt.figure(figsize=(20, 7.5), facecolor=background_color)
-    
-    gs = GridSpec(1, 4, figure=fig, wspace=0.0, hspace=0.0,
-                  left=0.0, right=1.0, top=0.90, bottom=0.03)
-    
-    labels = ["Reality", "Your Model", "Selection Bias", "Estimate"]
-    panel_data = [original_img, stipple_img, block_letter_img, masked_stipple_img]
-    
-    # Create each panel and add labels above
-    for i, (label, img_data) in enumerate(zip(labels, panel_data)):
-        ax = fig.add_subplot(gs[0, i])
-        ax.imshow(img_data, cmap='gray', vmin=0, vmax=1, aspect='auto')
-        ax.axis('off')
-        
-        # Add label text above the panel, positioned above the top border
-        panel_center = 0.125 + i * 0.25  # Center of each panel
-        fig.text(panel_center, 0.95, label, 
-                fontsize=22, fontweight='bold', ha='center', va='top',
-                color='black', zorder=20)
-    
-    # Add vertical separator lines between panels
-    for x_pos in [0.25, 0.5, 0.75]:
-        line = Line2D([x_pos, x_pos], [0.03, 0.90],
-                     transform=fig.transFigure,
-                     color='lightblue',
-                     linewidth=10,
-                     clip_on=False,
-                     zorder=10)
-        fig.add_artist(line)
-    
-    # Add blue border around the entire meme (top, bottom, left, right)
-    # Top border - increased thickness, positioned below labels
-    top_line = Line2D([0.0, 1.0], [0.92, 0.92],
-                     transform=fig.transFigure,
-                     color='lightblue',
-                     linewidth=25,
-                     clip_on=False,
-                     zorder=10)
-    fig.add_artist(top_line)
-    
-    # Bottom border
-    bottom_line = Line2D([0.0, 1.0], [0.03, 0.03],
-                        transform=fig.transFigure,
-                        color='lightblue',
-                        linewidth=10,
-                        clip_on=False,
-                        zorder=10)
-    fig.add_artist(bottom_line)
-    
-    # Left border
-    left_line = Line2D([0.0, 0.0], [0.03, 0.90],
-                      transform=fig.transFigure,
-                      color='lightblue',
-                      linewidth=10,
-                      clip_on=False,
-                      zorder=10)
-    fig.add_artist(left_line)
-    
-    # Right border
-    right_line = Line2D([1.0, 1.0], [0.03, 0.90],
-                       transform=fig.transFigure,
-                       color='lightblue',
-                       linewidth=10,
-                       clip_on=False,
-                       zorder=10)
-    fig.add_artist(right_line)
-    
-    plt.subplots_adjust(left=0.0, right=1.0, top=0.90, bottom=0.03, wspace=0.0, hspace=0.0)
-    plt.savefig(output_path, dpi=dpi, facecolor=background_color, 
-                bbox_inches='tight', pad_inches=0.0)
-    plt.close()
+    # render() checks that every panel matches the original image's shape and
+    # refuses silently promoted float64 panels
+    renderer = MemeRenderer(h, w, background_color=background_color)
+    renderer.render(
+        [original_img, stipple_img, block_letter_img, masked_stipple_img],
+        output_path,
+        dpi=dpi,
+        compress_level=compress_level,
+        palette_colors=palette_colors,
+        verbose=verbose
+    )
     
     print(f"Statistics meme saved to: {output_path}")
     print(f"  Image dimensions: {w} × {h} pixels per panel")
-    print(f"  Total meme size: {w * 4} × {h} pixels")
+    print(f"  Total meme size: {renderer.canvas_w} × {renderer.canvas_h} pixels")
     print(f"  Resolution: {dpi} DPI")
-
@@ -0,0 +1,72 @@
+"""
+Conversions between the pipeline's canonical uint8 images and [0, 1] floats.
+Images stay uint8 (0 = black, 255 = white) between steps; use these adapters
+only at the outermost boundary, e.g. around the float-based stippling step.
+"""
+
+import numpy as np
+
+
+def from_float(img: np.ndarray) -> np.ndarray:
+    """
+    Convert a float image with values in [0, 1] to uint8 in [0, 255].
+    
+    Values are clipped to [0, 1] and rounded to the nearest 1/255 step.
+    uint8 images are returned unchanged.
+    """
+    if img.dtype == np.uint8:
+        return img
+    scaled = np.clip(img, 0.0, 1.0) * np.float32(255)
+    img_u8 = np.empty(img.shape, dtype=np.uint8)
+    np.rint(scaled, out=img_u8, casting='unsafe')
+    return img_u8
+
+
+def to_float(img: np.ndarray) -> np.ndarray:
+    """
+    Convert a uint8 image with values in [0, 255] to float32 in [0, 1].
+    
+    Multiplies by a float32 reciprocal straight into the output, so there are
+    no float64 temporaries.
+    """
+    img_f32 = np.empty(img.shape, dtype=np.float32)
+    np.multiply(img, np.float32(1.0 / 255.0), out=img_f32, casting='unsafe')
+    return img_f32
+
+
+def audit_dtype(name: str, img: np.ndarray, verbose: bool = False) -> np.ndarray:
+    """
+    Check that an image uses one of the pipeline's dtypes (uint8 or float32).
+    
+    A float64 image usually comes from a silent promotion (e.g. a stray
+    ``/ 255.0`` or mixing with a float64 array) and doubles every downstream
+    allocation, so it is rejected rather than converted.
+    
+    Parameters
+    ----------
+    name : str
+        Name of the image, used in the report and error message
+    img : np.ndarray
+        Image to check
+    verbose : bool
+        If True, print the dtype and memory footprint of the image
+    
+    Returns
+    -------
+    img : np.ndarray
+        The input image, unchanged
+    
+    Raises
+    ------
+    ValueError
+        If the image is not uint8 or float32.
+    """
+    if verbose:
+        print(f"  {name}: {img.dtype}, {img.itemsize} bytes/pixel, "
+              f"{img.nbytes / 1e6:.2f} MB")
+    if img.dtype not in (np.uint8, np.float32):
+        message = f"{name} is {img.dtype}; expected uint8 or float32."
+        if img.dtype == np.float64:
+            message += " Check for an unintended float64 promotion."
+        raise ValueError(message)
+    return img
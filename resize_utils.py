@@ -0,0 +1,88 @@
+"""
+Opt-in resizing helpers for panels whose shape does not match the original image.
+create_statistics_meme requires pre-sized inputs; use these to fix a mismatch first.
+"""
+
+import numpy as np
+from PIL import Image
+
+
+def _resize_batch(
+    images: list[np.ndarray],
+    hw: tuple[int, int],
+    area: bool
+) -> list[np.ndarray]:
+    """Resize images to hw, either with Lanczos or with area/bilinear filtering."""
+    h, w = hw
+    resized = []
+    for img in images:
+        if img.dtype != np.uint8:
+            img = img.astype(np.float32, copy=False)
+        if img.shape == (h, w):
+            resized.append(img)
+            continue
+        if area:
+            # Area averaging when shrinking, bilinear when enlarging
+            shrinking = h <= img.shape[0] and w <= img.shape[1]
+            resample = Image.Resampling.BOX if shrinking else Image.Resampling.BILINEAR
+        else:
+            resample = Image.Resampling.LANCZOS
+        img_pil = Image.fromarray(img)
+        img_resized = img_pil.resize((w, h), resample)
+        resized.append(np.array(img_resized))
+    return resized
+
+
+def resize_lanczos_batch(
+    images: list[np.ndarray],
+    hw: tuple[int, int]
+) -> list[np.ndarray]:
+    """
+    Resize 2D grayscale images to a common (height, width) with Lanczos resampling.
+    
+    uint8 images are resized directly as PIL 'L' images and float images as
+    PIL 'F' images, so there is no float -> uint8 -> float round trip.
+    Images that already have the target shape are not resampled.
+    
+    Parameters
+    ----------
+    images : list[np.ndarray]
+        2D arrays (height, width), either uint8 or floating point
+    hw : tuple[int, int]
+        Target (height, width)
+    
+    Returns
+    -------
+    resized : list[np.ndarray]
+        Images with shape hw, each keeping its input dtype
+        (floating point images are returned as float32)
+    """
+    return _resize_batch(images, hw, area=False)
+
+
+def resize_area_batch(
+    images: list[np.ndarray],
+    hw: tuple[int, int]
+) -> list[np.ndarray]:
+    """
+    Resize 2D grayscale images to a common (height, width) with area averaging.
+    
+    Uses a box filter when shrinking and bilinear interpolation when
+    enlarging. This is cheaper than Lanczos and better suited to binary
+    stipple and letter panels, which gain nothing from a sinc window.
+    Like resize_lanczos_batch, images are resized in their own dtype.
+    
+    Parameters
+    ----------
+    images : list[np.ndarray]
+        2D arrays (height, width), either uint8 or floating point
+    hw : tuple[int, int]
+        Target (height, width)
+    
+    Returns
+    -------
+    resized : list[np.ndarray]
+        Images with shape hw, each keeping its input dtype
+        (floating point images are returned as float32)
+    """
+    return _resize_batch(images, hw, area=True)
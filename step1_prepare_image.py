@@ -6,6 +6,7 @@ while maintaining aspect ratio.
 
 import numpy as np
 from PIL import Image
+from dtype_utils import to_float
 
 
 def prepare_image(
@@ -41,7 +42,7 @@ def prepare_image(
         original_img = original_img.convert('L')
     
     # Convert to numpy array and normalize to [0, 1]
-    img_array = np.array(original_img, dtype=np.float32) / 255.0
+    img_array = to_float(np.asarray(original_img))
     
     # Resize if needed
     if target_size is not None:
@@ -50,7 +51,7 @@ def prepare_image(
         img_resized_pil = original_img.resize(new_size, Image.Resampling.LANCZOS)
         if img_resized_pil.mode != 'L':
             img_resized_pil = img_resized_pil.convert('L')
-        img_resized = np.array(img_resized_pil, dtype=np.float32) / 255.0
+        img_resized = to_float(np.asarray(img_resized_pil))
         print(f"Resized image to target size: {img_resized.shape}")
     elif img_array.shape[0] > max_size or img_array.shape[1] > max_size:
         # Resize to fit within max_size while maintaining aspect ratio
@@ -59,7 +60,7 @@ def prepare_image(
         img_resized_pil = original_img.resize(new_size, Image.Resampling.LANCZOS)
         if img_resized_pil.mode != 'L':
             img_resized_pil = img_resized_pil.convert('L')
-        img_resized = np.array(img_resized_pil, dtype=np.float32) / 255.0
+        img_resized = to_float(np.asarray(img_resized_pil))
         print(f"Resized image from {img_array.shape} to {img_resized.shape} for processing")
     else:
         img_resized = img_array.copy()
@@ -3,9 +3,41 @@ Step 4: Create a block letter matching the image dimensions.
 Generates a bold letter (default "S") on a white background to represent selection bias.
 """
 
+import functools
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import os
+from matplotlib import font_manager
+from matplotlib.font_manager import FontProperties
+from dtype_utils import to_float
+
+
+@functools.lru_cache(maxsize=1)
+def _find_bold_font_path() -> str:
+    """
+    Resolve a bold sans-serif font through matplotlib's font cache.
+    Falls back to matplotlib's bundled DejaVu Sans if no system font matches.
+    """
+    return font_manager.findfont(
+        FontProperties(family="DejaVu Sans", weight="bold"),
+        fallback_to_default=True
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, parsing each (path, size) only once."""
+    return ImageFont.truetype(font_path, font_size)
+
+
+def load_bold_font(font_size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """
+    Return the cached bold font at the given size.
+    Falls back to PIL's default font if the TrueType font cannot be loaded.
+    """
+    try:
+        return _load_font(_find_bold_font_path(), font_size)
+    except Exception:
+        return ImageFont.load_default()
 
 
 def create_block_letter_s(
@@ -32,71 +64,60 @@ def create_block_letter_s(
     Returns
     -------
     block_letter : np.ndarray
-        2D numpy array (height × width) with values in [0, 1]
-        Black letter (0.0) on white background (1.0)
+        2D uint8 array (height × width) with values in [0, 255]
+        Black letter (0) on white background (255)
     """
-    # Create a white background image
-    img = Image.new('L', (width, height), color=255)
-    draw = ImageDraw.Draw(img)
-    
     # Calculate font size based on the image height for better scaling
     font_size = int(height * font_size_ratio)
     
-    # Try to find a suitable bold font
-    font = None
-    
-    # Common system font paths (cross-platform)
-    font_paths = [
-        # Windows
-        "C:/Windows/Fonts/arialbd.ttf",  # Arial Bold
-        "C:/Windows/Fonts/arial.ttf",    # Arial
-        "C:/Windows/Fonts/calibrib.ttf", # Calibri Bold
-        "C:/Windows/Fonts/timesbd.ttf",  # Times Bold
-        # macOS
-        "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
-        "/Library/Fonts/Arial Bold.ttf",
-        "/System/Library/Fonts/Helvetica.ttc",
-        # Linux
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-        "/usr/share/fonts/truetype/noto/NotoSans-Bold.ttf",
-    ]
+    # Load a bold font
+    font = load_bold_font(font_size)
     
-    # Try to load a bold font
-    for font_path in font_paths:
-        if os.path.exists(font_path):
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                break
-            except Exception:
-                continue
+    # Get text bounding box to center the letter
+    left, top, right, bottom = font.getbbox(letter, 'L')
+    text_width = right - left
+    text_height = bottom - top
     
-    # If no font found, use default (bitmap font)
-    if font is None:
-        try:
-            # Try to use a default truetype font
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except Exception:
-            # Fall back to default bitmap font
-            font = ImageFont.load_default()
+    # Calculate position of the letter's bounding box in the image
+    x = (width - text_width) // 2
+    y = (height - text_height) // 2
     
-    # Get text bounding box to center the letter
-    bbox = draw.textbbox((0, 0), letter, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    # Create the white background directly as a uint8 array
+    # 0 = black, 255 = white: black letter on white background
+    # Consumers threshold in uint8 space; use create_block_letter_s_f32
+    # when a [0, 1] float image is needed
+    block_letter = np.full((height, width), 255, dtype=np.uint8)
     
-    # Calculate position to center the letter
-    x = (width - text_width) // 2 - bbox[0]
-    y = (height - text_height) // 2 - bbox[1]
+    if text_width <= 0 or text_height <= 0:
+        return block_letter
     
-    # Draw the letter in black
-    draw.text((x, y), letter, fill=0, font=font)
+    # Rasterize only the glyph's bounding box and copy it into the array,
+    # clipped to the image bounds
+    glyph = Image.new('L', (text_width, text_height), color=255)
+    ImageDraw.Draw(glyph).text((-left, -top), letter, fill=0, font=font)
+    glyph_array = np.asarray(glyph)
     
-    # Convert PIL image to numpy array and normalize to [0, 1]
-    # PIL image: 0 = black, 255 = white
-    # After normalization: 0.0 = black, 1.0 = white
-    # This matches the requirement: black letter (0.0) on white background (1.0)
-    img_array = np.array(img, dtype=np.float32) / 255.0
+    y0, y1 = max(y, 0), min(y + text_height, height)
+    x0, x1 = max(x, 0), min(x + text_width, width)
+    if y1 > y0 and x1 > x0:
+        block_letter[y0:y1, x0:x1] = glyph_array[y0 - y:y1 - y, x0 - x:x1 - x]
     
-    return img_array
+    return block_letter
+
 
+def create_block_letter_s_f32(
+    height: int,
+    width: int,
+    letter: str = "S",
+    font_size_ratio: float = 0.9
+) -> np.ndarray:
+    """
+    Float version of ``create_block_letter_s``.
+    
+    Returns
+    -------
+    block_letter : np.ndarray
+        2D float32 array (height × width) with values in [0, 1]
+        Black letter (0.0) on white background (1.0)
+    """
+    return to_float(create_block_letter_s(height, width, letter, font_size_ratio))
@@ -3,13 +3,138 @@ Step 5: Create a masked stippled image by applying a block letter mask.
 Removes stipples in the masked areas to demonstrate selection bias.
 """
 
+import functools
 import numpy as np
 
 
+@functools.lru_cache(maxsize=1)
+def _masked_stipple_kernel():
+    """
+    Import Numba and build the fused masking kernel on first use.
+    Returns None if Numba is not installed.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    @numba.njit(parallel=True, cache=True)
+    def kernel(stipple, mask, threshold, out):
+        """Fused single-pass masking: one read of each input, one write."""
+        h, w = stipple.shape
+        for i in numba.prange(h):
+            for j in range(w):
+                out[i, j] = 255 if mask[i, j] < threshold else stipple[i, j]
+    
+    return kernel
+
+
+def _require_uint8(name: str, img: np.ndarray) -> None:
+    """Raise ValueError unless img is uint8 (the pipeline's canonical dtype)."""
+    if img.dtype != np.uint8:
+        message = f"{name} must be uint8, got {img.dtype}."
+        if np.issubdtype(img.dtype, np.floating):
+            message += " Convert float images with dtype_utils.from_float."
+        raise ValueError(message)
+
+
+def _check_threshold(threshold: int) -> int:
+    """Return threshold as an int, raising ValueError unless it is an integer in 0-256."""
+    # The threshold is on the uint8 scale; a [0, 1] float would silently
+    # remove almost nothing, so it is rejected like float images are
+    if (isinstance(threshold, bool)
+            or not isinstance(threshold, (int, np.integer))
+            or not 0 <= threshold <= 256):
+        raise ValueError(
+            f"threshold must be an integer in 0-256, got {threshold!r}. "
+            f"For a [0, 1] threshold t use round(t * 255)."
+        )
+    return int(threshold)
+
+
+def prepare_removal_mask(
+    mask_u8: np.ndarray,
+    threshold: int = 128
+) -> np.ndarray:
+    """
+    Threshold a uint8 mask once into a removal layer for apply_removal_mask.
+    
+    When many stipple images share the same mask (animation frames, parameter
+    sweeps), compute this once and reuse it so the mask compare is not redone
+    for every image.
+    
+    Parameters
+    ----------
+    mask_u8 : np.ndarray
+        Mask image as 2D uint8 array (height, width)
+        0 = black (mask area, remove stipples)
+        255 = white (keep area, preserve stipples)
+    threshold : int
+        Pixels of the mask below threshold (an integer in 0-256) are
+        considered part of the mask (remove stipples). Default 128.
+    
+    Returns
+    -------
+    removal_mask : np.ndarray
+        2D uint8 array, 255 where stipples are removed and 0 where they are kept
+    
+    Raises
+    ------
+    ValueError
+        If the mask is not uint8 or the threshold is not an integer in 0-256.
+    """
+    _require_uint8("mask_u8", mask_u8)
+    threshold = _check_threshold(threshold)
+    
+    removal_mask = (mask_u8 < threshold).view(np.uint8)
+    removal_mask *= np.uint8(255)
+    return removal_mask
+
+
+def apply_removal_mask(
+    stipple_u8: np.ndarray,
+    removal_mask: np.ndarray
+) -> np.ndarray:
+    """
+    Remove stipples using a removal layer from prepare_removal_mask.
+    
+    Parameters
+    ----------
+    stipple_u8 : np.ndarray
+        Stippled image as 2D uint8 array (height, width)
+        0 = black dot (stipple), 255 = white background
+    removal_mask : np.ndarray
+        2D uint8 array, 255 where stipples are removed and 0 where they are kept
+    
+    Returns
+    -------
+    masked_stipple : np.ndarray
+        2D uint8 array with the same shape as the input images
+    
+    Raises
+    ------
+    ValueError
+        If either image is not uint8 or their shapes differ.
+    """
+    _require_uint8("stipple_u8", stipple_u8)
+    _require_uint8("removal_mask", removal_mask)
+    if stipple_u8.shape != removal_mask.shape:
+        raise ValueError(
+            f"Images must have the same shape. "
+            f"stipple_img: {stipple_u8.shape}, removal_mask: {removal_mask.shape}"
+        )
+    
+    # stipple | 0xFF forces white in masked areas, stipple | 0x00 keeps it
+    masked_stipple = np.empty_like(stipple_u8)
+    np.bitwise_or(stipple_u8, removal_mask, out=masked_stipple)
+    return masked_stipple
+
+
 def create_masked_stipple(
     stipple_img: np.ndarray,
     mask_img: np.ndarray,
-    threshold: float = 0.5
+    threshold: int = 128,
+    use_numba: bool = False
 ) -> np.ndarray:
     """
     Apply a mask to a stippled image, removing stipples in masked areas.
@@ -18,43 +143,53 @@ def create_masked_stipple(
     data points (stipples) where the mask is dark, demonstrating how
     selection bias affects data analysis.
     
+    Images are uint8 throughout (see dtype_utils.from_float for float
+    stipples). The masking is a single ``np.bitwise_or`` pass. To mask many
+    stipple images with the same mask, call ``prepare_removal_mask`` once and
+    ``apply_removal_mask`` per image.
+    
     Parameters
     ----------
     stipple_img : np.ndarray
-        Stippled image as 2D array (height, width) with values in [0, 1]
-        0.0 = black dot (stipple), 1.0 = white background
+        Stippled image as 2D uint8 array (height, width)
+        0 = black dot (stipple), 255 = white background
     mask_img : np.ndarray
-        Mask image as 2D array (height, width) with values in [0, 1]
-        0.0 = black (mask area, remove stipples)
-        1.0 = white (keep area, preserve stipples)
-    threshold : float
-        Threshold value to determine what counts as "part of the mask"
+        Mask image as 2D uint8 array (height, width)
+        0 = black (mask area, remove stipples)
+        255 = white (keep area, preserve stipples)
+    threshold : int
+        Threshold value (0-256) to determine what counts as "part of the mask"
         Pixels below threshold are considered part of the mask (remove stipples)
-        Pixels above threshold are considered keep area (preserve stipples)
-        Default 0.5
+        Pixels at or above threshold are considered keep area (preserve stipples)
+        Default 128, i.e. round(0.5 * 255)
+    use_numba : bool
+        If True and Numba is installed, run the compare-and-select as one
+        parallel fused kernel instead. Importing and compiling the kernel
+        costs far more than masking a typical image, so this only pays off
+        for very large images masked repeatedly in one process. Default False.
     
     Returns
     -------
     masked_stipple : np.ndarray
-        2D numpy array with the same shape as the input images
-        Stipples are removed (set to white/1.0) where mask is dark (below threshold)
-        Stipples are preserved where mask is light (above threshold)
+        2D uint8 array with the same shape as the input images
+        Stipples are removed (set to white/255) where mask is dark (below threshold)
+        Stipples are preserved where mask is light (at or above threshold)
     """
-    # Ensure both images have the same shape
+    # Ensure both images have the same shape; dtype and threshold are checked
+    # by prepare_removal_mask and apply_removal_mask
     if stipple_img.shape != mask_img.shape:
         raise ValueError(
             f"Images must have the same shape. "
             f"stipple_img: {stipple_img.shape}, mask_img: {mask_img.shape}"
         )
     
-    # Create a copy of the stippled image to avoid modifying the original
-    masked_stipple = stipple_img.copy()
-    
-    # Identify mask areas (where mask is dark, below threshold)
-    mask_areas = mask_img < threshold
+    kernel = _masked_stipple_kernel() if use_numba else None
+    if kernel is not None:
+        # The kernel bypasses the NumPy helpers, so run their checks here
+        _require_uint8("stipple_img", stipple_img)
+        _require_uint8("mask_img", mask_img)
+        masked_stipple = np.empty_like(stipple_img)
+        kernel(stipple_img, mask_img, _check_threshold(threshold), masked_stipple)
+        return masked_stipple
     
-    # Remove stipples in masked areas by setting them to white (1.0)
-    masked_stipple[mask_areas] = 1.0
-    
-    return masked_stipple
-
+    return apply_removal_mask(stipple_img, prepare_removal_mask(mask_img, threshold))